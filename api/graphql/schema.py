@@ -5,6 +5,8 @@ from datetime import datetime
 from enum import Enum
 
 import strawberry
+from strawberry.extensions import ParserCache, ValidationCache
+from strawberry.schema.config import StrawberryConfig
 
 from api.repositories.projects import (
     CreateProjectRequest,
@@ -15,6 +17,12 @@ from api.repositories.projects import (
 )
 from api.services.storage import StorageService
 
+# Distinct query documents kept parsed and validated
+GRAPHQL_DOCUMENT_CACHE_SIZE = 256
+
+# Operations accepted in one batched (JSON array) request
+GRAPHQL_MAX_BATCH_OPERATIONS = 10
+
 
 def encode_cursor(project_id: str) -> str:
     return base64.b64encode(f"pid:{project_id}".encode()).decode()
@@ -221,28 +229,31 @@ class Query:
         # Convert status enum if provided
         repo_status = convert_status_to_repo_enum(status) if status else None
 
-        rows, has_next = repo.list_projects(
+        # Get total count first; the cheap COUNT lets us skip the ordered SELECT when empty
+        total_count = repo.get_project_count(
             name_contains=name_contains,
             status=repo_status,  # Use converted enum
             owner_id=owner_id,
             tags=tags,
-            first=first,
-            after_id=after_id,
-            order_by=order_by.value,
-            order_direction=order_direction.value,
         )
 
+        if total_count:
+            rows, has_next = repo.list_projects(
+                name_contains=name_contains,
+                status=repo_status,  # Use converted enum
+                owner_id=owner_id,
+                tags=tags,
+                first=first,
+                after_id=after_id,
+                order_by=order_by.value,
+                order_direction=order_direction.value,
+            )
+        else:
+            rows, has_next = [], False
+
         edges = [ProjectEdge(cursor=encode_cursor(r.id), node=Project.from_record(r)) for r in rows]
         end_cursor = edges[-1].cursor if edges else None
 
-        # Get total count
-        total_count = repo.get_project_count(
-            name_contains=name_contains,
-            status=repo_status,  # Use converted enum
-            owner_id=owner_id,
-            tags=tags,
-        )
-
         # Save result to Blob Storage
         try:
             storage = StorageService()
@@ -468,4 +479,15 @@ class Mutation:
 
 
 # Create schema with mutations
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+# Clients send the same handful of documents over and over; cache their parse and validation
+# results so repeat requests go straight to execution. Independent operations can also be sent
+# together as a JSON array to share one HTTP round trip.
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    config=StrawberryConfig(batching_config={"max_operations": GRAPHQL_MAX_BATCH_OPERATIONS}),
+    extensions=[
+        ParserCache(maxsize=GRAPHQL_DOCUMENT_CACHE_SIZE),
+        ValidationCache(maxsize=GRAPHQL_DOCUMENT_CACHE_SIZE),
+    ],
+)
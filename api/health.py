@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import os
+
+from fastapi import APIRouter
+
+# Root and health routes, mounted on the main app; the repository is only imported when
+# /healthz actually runs
+router = APIRouter()
+
+
+def _environment() -> str:
+    return os.getenv("APP_ENV", "azure").lower()
+
+
+@router.get("/")
+def root():
+    """Root endpoint with basic API information"""
+    return {
+        "message": "mseONE PoC API",
+        "version": "1.0.0",
+        "environment": _environment(),
+        "graphql_endpoint": "/graphql",
+        "health_check": "/healthz",
+    }
+
+
+@router.get("/healthz")
+def health():
+    """Enhanced health check endpoint"""
+    env = _environment()
+    try:
+        # Test basic imports
+        from api.repositories.projects import ProjectRepository
+
+        health_info = {
+            "status": "ok",
+            "environment": env,
+            "cosmos_configured": bool(os.getenv("COSMOS_KEY")),
+            "storage_configured": bool(os.getenv("STORAGE_KEY")),
+        }
+
+        # Test Cosmos connection with a cheap metadata read; the client is cached, so building
+        # a repository alone no longer touches the network after the first probe
+        try:
+            ProjectRepository().container.read()
+            health_info["cosmos_connection"] = "ok"
+        except Exception as e:
+            health_info["cosmos_connection"] = f"error: {str(e)}"
+            health_info["status"] = "degraded"
+
+        return health_info
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "environment": env,
+        }
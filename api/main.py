@@ -3,11 +3,13 @@ from __future__ import annotations
 import os
 import sys
 
+import orjson
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from strawberry.fastapi import GraphQLRouter
 
 from api.graphql.schema import schema
+from api.health import router as health_router
 
 if "pytest" in sys.modules or "PYTEST_CURRENT_TEST" in os.environ:
     os.environ["APP_ENV"] = "local"
@@ -23,6 +25,17 @@ else:
     print("🔐 Using Azure AD authentication")
     from api.auth_azure import require_aad_bearer as auth_dep
 
+
+class ORJSONGraphQLRouter(GraphQLRouter):
+    """GraphQL router that decodes requests and encodes responses with orjson"""
+
+    def decode_json(self, data: str | bytes) -> object:
+        return orjson.loads(data)
+
+    def encode_json(self, data: object) -> str:
+        return orjson.dumps(data).decode()
+
+
 # Create FastAPI app first
 app = FastAPI(title="mseONE PoC API")
 
@@ -45,52 +58,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Root and health routes
+app.include_router(health_router)
+
 # Create GraphQL router
-graphql_app = GraphQLRouter(schema)
+graphql_app = ORJSONGraphQLRouter(schema)
 
 # Mount GraphQL with dependency
 app.include_router(graphql_app, prefix="/graphql", dependencies=[Depends(auth_dep)])
-
-
-@app.get("/")
-def root():
-    """Root endpoint with basic API information"""
-    return {
-        "message": "mseONE PoC API",
-        "version": "1.0.0",
-        "environment": ENV,
-        "graphql_endpoint": "/graphql",
-        "health_check": "/healthz",
-    }
-
-
-@app.get("/healthz")
-def health():
-    """Enhanced health check endpoint"""
-    try:
-        # Test basic imports
-        from api.repositories.projects import ProjectRepository
-
-        health_info = {
-            "status": "ok",
-            "environment": ENV,
-            "cosmos_configured": bool(os.getenv("COSMOS_KEY")),
-            "storage_configured": bool(os.getenv("STORAGE_KEY")),
-        }
-
-        # Test Cosmos connection (lightweight check)
-        try:
-            ProjectRepository()
-            health_info["cosmos_connection"] = "ok"
-        except Exception as e:
-            health_info["cosmos_connection"] = f"error: {str(e)}"
-            health_info["status"] = "degraded"
-
-        return health_info
-
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e),
-            "environment": ENV,
-        }
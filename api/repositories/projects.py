@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta  # FIXED: Moved import to top
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
+from uuid import uuid4
 
 from azure.cosmos import CosmosClient, PartitionKey, exceptions
 
+# Containers are partitioned on the document id
+PARTITION_KEY_FIELD = "id"
+
+# Upper bound on concurrent writes during a bulk create
+BULK_MAX_WORKERS = 16
+
 
 class ProjectStatus(str, Enum):
     ACTIVE = "active"
@@ -15,6 +25,10 @@ class ProjectStatus(str, Enum):
     COMPLETED = "completed"
 
 
+_STATUS_BY_VALUE = {status.value: status for status in ProjectStatus}
+_fromisoformat = datetime.fromisoformat
+
+
 @dataclass
 class ProjectRecord:
     id: str
@@ -33,6 +47,7 @@ class ProjectRecord:
         return {
             "id": self.id,
             "name": self.name,
+            "name_lc": self.name.lower(),  # Lowercase copy for index-backed prefix search
             "description": self.description,
             "status": self.status.value,
             "owner_id": self.owner_id,
@@ -47,17 +62,21 @@ class ProjectRecord:
     @classmethod
     def from_dict(cls, data: dict) -> ProjectRecord:
         """Create from Cosmos DB document"""
+        # Hot path for every query result: bind lookups locally and skip Enum.__call__
+        get = data.get
+        fromiso = _fromisoformat
+        due_date = get("due_date")
         return cls(
             id=data["id"],
             name=data["name"],
-            description=data.get("description"),
-            status=ProjectStatus(data["status"]),
-            owner_id=data.get("owner_id"),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
-            tags=data.get("tags", []),
-            budget=data.get("budget"),
-            due_date=datetime.fromisoformat(data["due_date"]) if data.get("due_date") else None,
+            description=get("description"),
+            status=_STATUS_BY_VALUE[data["status"]],
+            owner_id=get("owner_id"),
+            created_at=fromiso(data["created_at"]),
+            updated_at=fromiso(data["updated_at"]),
+            tags=get("tags") or [],
+            budget=get("budget"),
+            due_date=fromiso(due_date) if due_date else None,
         )
 
 
@@ -87,6 +106,70 @@ class UpdateProjectRequest:
     due_date: datetime | None = None
 
 
+# Fixed query texts, kept identical across calls so Cosmos can reuse the query plan
+# One COUNT per status: the SDK cannot run cross-partition GROUP BY, and /id makes every query
+# cross-partition
+_STATUS_COUNT_QUERY = "SELECT VALUE COUNT(1) FROM c WHERE c.type = 'project' AND c.status = @status"
+_BY_OWNER_QUERY = "SELECT * FROM c WHERE c.type = 'project' AND c.owner_id = @owner_id"
+_BY_TAG_QUERY = "SELECT * FROM c WHERE c.type = 'project' AND ARRAY_CONTAINS(c.tags, @tag)"
+_SEARCH_QUERY = (
+    "SELECT * FROM c WHERE c.type = 'project'"
+    " AND (CONTAINS(c.name, @search, true) OR CONTAINS(c.description, @search, true))"
+    " ORDER BY c.updated_at DESC"
+)
+_DUE_SOON_QUERY = (
+    "SELECT * FROM c WHERE c.type = 'project'"
+    " AND c.status IN ('active', 'draft')"
+    " AND c.due_date != null AND c.due_date <= @cutoff_date"
+    " ORDER BY c.due_date ASC"
+)
+_BUDGET_SUMMARY_QUERY = (
+    "SELECT SUM(c.budget) as total_budget, AVG(c.budget) as average_budget,"
+    " MAX(c.budget) as max_budget, MIN(c.budget) as min_budget"
+    " FROM c WHERE c.type = 'project' AND c.budget != null"
+)
+
+
+@lru_cache(maxsize=1)
+def get_cosmos_client(
+    cosmos_uri: str, cosmos_key: str, preferred_locations: tuple[str, ...] = ()
+) -> CosmosClient:
+    """Return a process-wide CosmosClient so connections and account metadata are reused"""
+    return CosmosClient(
+        cosmos_uri, credential=cosmos_key, preferred_locations=list(preferred_locations)
+    )
+
+
+def _build_filters(
+    name_contains: str | None,
+    status: ProjectStatus | None,
+    owner_id: str | None,
+    tags: list[str] | None,
+) -> tuple[str, list[dict]]:
+    """Build the shared WHERE clause suffix and its parameters in a single pass"""
+    clauses = []
+    parameters = []
+
+    if name_contains:
+        clauses.append(" AND CONTAINS(c.name, @name, true)")
+        parameters.append({"name": "@name", "value": name_contains})
+
+    if status:
+        clauses.append(" AND c.status = @status")
+        parameters.append({"name": "@status", "value": status.value})
+
+    if owner_id:
+        clauses.append(" AND c.owner_id = @owner_id")
+        parameters.append({"name": "@owner_id", "value": owner_id})
+
+    if tags:
+        for i, tag in enumerate(tags):
+            clauses.append(f" AND ARRAY_CONTAINS(c.tags, @tag{i})")
+            parameters.append({"name": f"@tag{i}", "value": tag})
+
+    return "".join(clauses), parameters
+
+
 class ProjectRepository:
     def __init__(self):
         # Connection configuration
@@ -96,12 +179,17 @@ class ProjectRepository:
         self.cosmos_key = os.getenv("COSMOS_KEY")
         self.database_name = os.getenv("COSMOS_DB", "projectsdb")
         self.container_name = os.getenv("COSMOS_CONTAINER", "projects")
+        self.preferred_locations = tuple(
+            region.strip()
+            for region in os.getenv("COSMOS_PREFERRED_LOCATIONS", "").split(",")
+            if region.strip()
+        )
 
         if not self.cosmos_key:
             raise RuntimeError("COSMOS_KEY environment variable is required")
 
-        # Initialize clients
-        self.client = CosmosClient(self.cosmos_uri, credential=self.cosmos_key)
+        # Initialize clients; the CosmosClient is shared across repository instances
+        self.client = get_cosmos_client(self.cosmos_uri, self.cosmos_key, self.preferred_locations)
         self.database = self.client.get_database_client(self.database_name)
         self.container = self.database.get_container_client(self.container_name)
 
@@ -114,7 +202,9 @@ class ProjectRepository:
             # Container doesn't exist, create it
             print("Creating projects container...")
             container = self.database.create_container(
-                id=self.container_name, partition_key=PartitionKey(path="/id"), offer_throughput=400
+                id=self.container_name,
+                partition_key=PartitionKey(path=f"/{PARTITION_KEY_FIELD}"),
+                offer_throughput=400,
             )
             print(f"Container {self.container_name} created successfully")
             return container
@@ -122,11 +212,10 @@ class ProjectRepository:
             print(f"Error checking container: {e}")
             raise
 
-    def create_project(self, request: CreateProjectRequest) -> ProjectRecord:
-        """Create a new project"""
-        now = datetime.utcnow()
-        project_id = f"proj_{int(now.timestamp() * 1000)}"  # Simple ID generation
-
+    def _build_record(
+        self, request: CreateProjectRequest, project_id: str, now: datetime
+    ) -> ProjectRecord:
+        """Validate a create request and build the record to persist"""
         # Validate name is not empty
         if not request.name or not request.name.strip():
             raise ValueError("Project name cannot be empty")
@@ -135,7 +224,7 @@ class ProjectRepository:
         if request.budget is not None and request.budget < 0:
             raise ValueError("Budget cannot be negative")
 
-        project = ProjectRecord(
+        return ProjectRecord(
             id=project_id,
             name=request.name.strip(),
             description=request.description.strip() if request.description else None,
@@ -148,6 +237,13 @@ class ProjectRepository:
             due_date=request.due_date,
         )
 
+    def create_project(self, request: CreateProjectRequest) -> ProjectRecord:
+        """Create a new project"""
+        now = datetime.utcnow()
+        project_id = f"proj_{int(now.timestamp() * 1000)}"  # Simple ID generation
+
+        project = self._build_record(request, project_id, now)
+
         try:
             self.container.create_item(body=project.to_dict())
             return project
@@ -156,6 +252,43 @@ class ProjectRepository:
         except Exception as e:
             raise RuntimeError(f"Failed to create project: {e}") from e  # FIXED
 
+    def create_projects_bulk(self, requests: list[CreateProjectRequest]) -> list[ProjectRecord]:
+        """Create many projects, writing them concurrently"""
+        now = datetime.utcnow()
+        stamp = int(now.timestamp() * 1000)
+
+        # Validate everything up front so a bad request is rejected before anything is written
+        projects = [
+            self._build_record(request, f"proj_{stamp}_{uuid4().hex[:12]}", now)
+            for request in requests
+        ]
+        if not projects:
+            return []
+
+        # With /id partitioning every project is its own partition, so writes are independent
+        # and not atomic; track what landed to report on failure
+        persisted: list[str] = []
+        errors: list[Exception] = []
+        with ThreadPoolExecutor(max_workers=min(BULK_MAX_WORKERS, len(projects))) as pool:
+            futures = {
+                pool.submit(self.container.create_item, body=project.to_dict()): project.id
+                for project in projects
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    persisted.append(futures[future])
+                except Exception as e:
+                    errors.append(e)
+
+        if errors:
+            error = errors[0]
+            detail = f"{error} (already created: {', '.join(sorted(persisted)) or 'none'})"
+            if isinstance(error, exceptions.CosmosResourceExistsError):
+                raise ValueError(f"Project already exists: {detail}") from error
+            raise RuntimeError(f"Failed to create projects: {detail}") from error
+        return projects
+
     def get_by_id(self, project_id: str) -> ProjectRecord | None:
         """Get project by ID"""
         try:
@@ -236,25 +369,8 @@ class ProjectRepository:
         """List projects with filtering and pagination"""
 
         # Build query
-        query = "SELECT * FROM c WHERE c.type = 'project'"
-        parameters = []
-
-        if name_contains:
-            query += " AND CONTAINS(UPPER(c.name), UPPER(@name))"
-            parameters.append({"name": "@name", "value": name_contains})
-
-        if status:
-            query += " AND c.status = @status"
-            parameters.append({"name": "@status", "value": status.value})
-
-        if owner_id:
-            query += " AND c.owner_id = @owner_id"
-            parameters.append({"name": "@owner_id", "value": owner_id})
-
-        if tags:
-            for i, tag in enumerate(tags):
-                query += f" AND ARRAY_CONTAINS(c.tags, @tag{i})"
-                parameters.append({"name": f"@tag{i}", "value": tag})
+        filters, parameters = _build_filters(name_contains, status, owner_id, tags)
+        query = "SELECT * FROM c WHERE c.type = 'project'" + filters
 
         # Handle pagination with cursor
         if after_id:
@@ -298,19 +414,19 @@ class ProjectRepository:
             query += f" ORDER BY c.id {order_direction.upper()}"
 
         try:
-            # Execute query with limit
-            items = list(
-                self.container.query_items(
-                    query=query,
-                    parameters=parameters,
-                    enable_cross_partition_query=True,
-                    max_item_count=first + 1,  # Get one extra to check if there are more
-                )
+            # Execute query, stopping after one extra item to check if there are more
+            items = self.container.query_items(
+                query=query,
+                parameters=parameters,
+                enable_cross_partition_query=True,
+                max_item_count=first + 1,
             )
 
             # Convert to ProjectRecord objects
-            projects = [ProjectRecord.from_dict(item) for item in items[:first]]
-            has_next_page = len(items) > first
+            projects = [ProjectRecord.from_dict(item) for item in islice(items, first + 1)]
+            has_next_page = len(projects) > first
+            if has_next_page:
+                projects.pop()
 
             return projects, has_next_page
 
@@ -326,25 +442,8 @@ class ProjectRepository:
     ) -> int:
         """Get total count of projects matching filters"""
 
-        query = "SELECT VALUE COUNT(1) FROM c WHERE c.type = 'project'"
-        parameters = []
-
-        if name_contains:
-            query += " AND CONTAINS(UPPER(c.name), UPPER(@name))"
-            parameters.append({"name": "@name", "value": name_contains})
-
-        if status:
-            query += " AND c.status = @status"
-            parameters.append({"name": "@status", "value": status.value})
-
-        if owner_id:
-            query += " AND c.owner_id = @owner_id"
-            parameters.append({"name": "@owner_id", "value": owner_id})
-
-        if tags:
-            for i, tag in enumerate(tags):
-                query += f" AND ARRAY_CONTAINS(c.tags, @tag{i})"
-                parameters.append({"name": f"@tag{i}", "value": tag})
+        filters, parameters = _build_filters(name_contains, status, owner_id, tags)
+        query = "SELECT VALUE COUNT(1) FROM c WHERE c.type = 'project'" + filters
 
         try:
             result = list(
@@ -357,35 +456,33 @@ class ProjectRepository:
             raise RuntimeError(f"Failed to get project count: {e}") from e  # FIXED
 
     def get_projects_by_status_summary(self) -> dict:
-        """Get summary of projects by status using individual queries"""
-        statuses = ["active", "archived", "draft", "completed"]
+        """Get summary of projects by status using one parameterized COUNT per status"""
         summary = {}
 
-        for status in statuses:
+        for status in ProjectStatus:
             try:
-                query = f"SELECT VALUE COUNT(1) FROM c WHERE c.type = 'project' AND c.status = '{status}'"
                 result = list(
-                    self.container.query_items(query=query, enable_cross_partition_query=True)
+                    self.container.query_items(
+                        query=_STATUS_COUNT_QUERY,
+                        parameters=[{"name": "@status", "value": status.value}],
+                        enable_cross_partition_query=True,
+                    )
                 )
-                count = result[0] if result else 0
-                if count > 0:
-                    summary[status] = count
             except Exception as e:
-                print(f"Warning: Failed to get count for status {status}: {e}")
-                summary[status] = 0
+                raise RuntimeError(f"Failed to count {status.value} projects: {e}") from e
+            count = result[0] if result else 0
+            if count > 0:
+                summary[status.value] = count
 
         return summary
 
     def get_projects_by_owner(self, owner_id: str) -> list[ProjectRecord]:
         """Get all projects for a specific owner"""
-        query = "SELECT * FROM c WHERE c.type = 'project' AND c.owner_id = @owner_id"
         parameters = [{"name": "@owner_id", "value": owner_id}]
 
         try:
-            items = list(
-                self.container.query_items(
-                    query=query, parameters=parameters, enable_cross_partition_query=True
-                )
+            items = self.container.query_items(
+                query=_BY_OWNER_QUERY, parameters=parameters, enable_cross_partition_query=True
             )
             return [ProjectRecord.from_dict(item) for item in items]
         except Exception as e:
@@ -393,14 +490,11 @@ class ProjectRepository:
 
     def get_projects_by_tag(self, tag: str) -> list[ProjectRecord]:
         """Get all projects containing a specific tag"""
-        query = "SELECT * FROM c WHERE c.type = 'project' AND ARRAY_CONTAINS(c.tags, @tag)"
         parameters = [{"name": "@tag", "value": tag}]
 
         try:
-            items = list(
-                self.container.query_items(
-                    query=query, parameters=parameters, enable_cross_partition_query=True
-                )
+            items = self.container.query_items(
+                query=_BY_TAG_QUERY, parameters=parameters, enable_cross_partition_query=True
             )
             return [ProjectRecord.from_dict(item) for item in items]
         except Exception as e:
@@ -408,47 +502,27 @@ class ProjectRepository:
 
     def search_projects(self, search_term: str, limit: int = 20) -> list[ProjectRecord]:
         """Search projects by name or description"""
-        query = """
-        SELECT * FROM c 
-        WHERE c.type = 'project' 
-        AND (CONTAINS(UPPER(c.name), UPPER(@search)) 
-             OR CONTAINS(UPPER(c.description), UPPER(@search)))
-        ORDER BY c.updated_at DESC
-        """
         parameters = [{"name": "@search", "value": search_term}]
 
         try:
-            items = list(
-                self.container.query_items(
-                    query=query,
-                    parameters=parameters,
-                    enable_cross_partition_query=True,
-                    max_item_count=limit,
-                )
+            items = self.container.query_items(
+                query=_SEARCH_QUERY,
+                parameters=parameters,
+                enable_cross_partition_query=True,
+                max_item_count=limit,
             )
-            return [ProjectRecord.from_dict(item) for item in items]
+            return [ProjectRecord.from_dict(item) for item in islice(items, limit)]
         except Exception as e:
             raise RuntimeError(f"Failed to search projects: {e}") from e  # FIXED
 
     def get_projects_due_soon(self, days: int = 7) -> list[ProjectRecord]:
         """Get projects due within specified days"""
         cutoff_date = (datetime.utcnow() + timedelta(days=days)).isoformat()
-
-        query = """
-        SELECT * FROM c 
-        WHERE c.type = 'project' 
-        AND c.status IN ('active', 'draft')
-        AND c.due_date != null 
-        AND c.due_date <= @cutoff_date
-        ORDER BY c.due_date ASC
-        """
         parameters = [{"name": "@cutoff_date", "value": cutoff_date}]
 
         try:
-            items = list(
-                self.container.query_items(
-                    query=query, parameters=parameters, enable_cross_partition_query=True
-                )
+            items = self.container.query_items(
+                query=_DUE_SOON_QUERY, parameters=parameters, enable_cross_partition_query=True
             )
             return [ProjectRecord.from_dict(item) for item in items]
         except Exception as e:
@@ -456,19 +530,11 @@ class ProjectRepository:
 
     def get_budget_summary(self) -> dict:
         """Get budget summary across all projects"""
-        query = """
-        SELECT 
-            SUM(c.budget) as total_budget,
-            AVG(c.budget) as average_budget,
-            MAX(c.budget) as max_budget,
-            MIN(c.budget) as min_budget
-        FROM c 
-        WHERE c.type = 'project' AND c.budget != null
-        """
-
         try:
             result = list(
-                self.container.query_items(query=query, enable_cross_partition_query=True)
+                self.container.query_items(
+                    query=_BUDGET_SUMMARY_QUERY, enable_cross_partition_query=True
+                )
             )
 
             if result and result[0]:
@@ -3,38 +3,118 @@
 Cosmos DB Setup and Seeding Script for mseONE PoC
 
 This script:
-1. Creates the proper Cosmos DB structure
+1. Creates the proper Cosmos DB structure, including composite indexes
 2. Seeds sample project data
 3. Validates the setup
-4. Creates indexes for better query performance
-
-FIXED: Cross-partition query issues with GROUP BY aggregates
 """
 
+import argparse
 import os
 import sys
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Any
 
 from azure.cosmos import CosmosClient, PartitionKey
-from azure.cosmos.exceptions import CosmosResourceExistsError
+from azure.cosmos.exceptions import CosmosResourceExistsError, CosmosResourceNotFoundError
+
+
+@dataclass(frozen=True, slots=True)
+class CosmosConfig:
+    uri: str
+    key: str | None
+    database: str
+    container: str
+    preferred_locations: tuple[str, ...]
+
+
+# Connection settings, read from the environment once
+CONFIG = CosmosConfig(
+    uri=os.getenv("COSMOS_URI", "https://mseonepoc-cosmos.documents.azure.com:443/"),
+    key=os.getenv("COSMOS_KEY"),
+    database=os.getenv("COSMOS_DB", "projectsdb"),
+    container=os.getenv("COSMOS_CONTAINER", "projects"),
+    preferred_locations=tuple(
+        region.strip()
+        for region in os.getenv("COSMOS_PREFERRED_LOCATIONS", "").split(",")
+        if region.strip()
+    ),
+)
+
+# Must match PARTITION_KEY_FIELD in api/repositories/projects.py. The API reads, replaces and
+# deletes projects by id alone, and owner_id is optional, so /id stays the partition key.
+PARTITION_KEY_PATH = "/id"
+
+# Upper bound on concurrent writes while seeding; high enough to overlap round trips on larger
+# seed sets, low enough not to burn through a 400 RU/s container into sustained 429s
+SEED_MAX_WORKERS = 32
+
+# Items per page when streaming validation queries
+QUERY_PAGE_SIZE = 100
+
+# Seeded project that validation reads back by id
+SAMPLE_PROJECT_ID = "proj_apollo_001"
+
+# Composite indexes for the type/status/owner filters combined with their ORDER BY columns
+INDEXING_POLICY = {
+    "indexingMode": "consistent",
+    "automatic": True,
+    # Only index properties that queries filter or sort on; everything else (description, budget,
+    # ...) skips index maintenance on every write
+    "includedPaths": [
+        {"path": "/type/?"},
+        {"path": "/status/?"},
+        {"path": "/owner_id/?"},
+        {"path": "/name/?"},
+        {"path": "/name_lc/?"},
+        {"path": "/tags/[]/?"},
+        {"path": "/created_at/?"},
+        {"path": "/updated_at/?"},
+        {"path": "/due_date/?"},
+    ],
+    "excludedPaths": [{"path": "/*"}, {"path": '/"_etag"/?'}],
+    "compositeIndexes": [
+        [{"path": "/type", "order": "ascending"}, {"path": "/created_at", "order": "descending"}],
+        [{"path": "/type", "order": "ascending"}, {"path": "/status", "order": "ascending"}],
+        [{"path": "/status", "order": "ascending"}, {"path": "/created_at", "order": "descending"}],
+        # Due-soon query: status filter ordered by due_date
+        [{"path": "/status", "order": "ascending"}, {"path": "/due_date", "order": "ascending"}],
+        # Owner filter on the paginated list, newest first
+        [
+            {"path": "/owner_id", "order": "ascending"},
+            {"path": "/created_at", "order": "descending"},
+        ],
+        [
+            {"path": "/owner_id", "order": "ascending"},
+            {"path": "/updated_at", "order": "descending"},
+        ],
+    ],
+}
 
 
+@lru_cache(maxsize=1)
 def get_cosmos_client():
-    """Get Cosmos DB client from environment variables"""
-    cosmos_uri = os.getenv("COSMOS_URI", "https://mseonepoc-cosmos.documents.azure.com:443/")
-    cosmos_key = os.getenv("COSMOS_KEY")
-
-    if not cosmos_key:
+    """Get the shared Cosmos DB client, built once from environment variables"""
+    if not CONFIG.key:
         print("ERROR: COSMOS_KEY environment variable is required")
         sys.exit(1)
 
-    return CosmosClient(cosmos_uri, credential=cosmos_key)
+    return CosmosClient(
+        CONFIG.uri,
+        credential=CONFIG.key,
+        consistency_level="Session",
+        preferred_locations=list(CONFIG.preferred_locations),
+    )
 
 
 def create_database_and_container(client: CosmosClient):
     """Create database and container with proper configuration"""
-    database_name = os.getenv("COSMOS_DB", "projectsdb")
-    container_name = os.getenv("COSMOS_CONTAINER", "projects")
+    database_name = CONFIG.database
+    container_name = CONFIG.container
 
     print(f"Setting up database: {database_name}")
 
@@ -50,165 +130,216 @@ def create_database_and_container(client: CosmosClient):
     try:
         container = database.create_container(
             id=container_name,
-            partition_key=PartitionKey(path="/id"),
+            partition_key=PartitionKey(path=PARTITION_KEY_PATH),
+            indexing_policy=INDEXING_POLICY,
             offer_throughput=400,  # Minimum for shared throughput
         )
         print(f"✅ Created container: {container_name}")
     except CosmosResourceExistsError:
-        container = database.get_container_client(container_name)
-        print(f"✅ Container already exists: {container_name}")
+        # Indexing policy can be changed in place; Cosmos rebuilds the index in the background.
+        # Replacing resets unspecified settings to their defaults, so carry the current TTL and
+        # conflict resolution policy over
+        existing = database.get_container_client(container_name).read()
+        container = database.replace_container(
+            container_name,
+            partition_key=PartitionKey(path=PARTITION_KEY_PATH),
+            indexing_policy=INDEXING_POLICY,
+            default_ttl=existing.get("defaultTtl"),
+            conflict_resolution_policy=existing.get("conflictResolutionPolicy"),
+            analytical_storage_ttl=existing.get("analyticalStorageTtl"),
+        )
+        print(f"✅ Container already exists, indexing policy updated: {container_name}")
+
+    # Load container properties (partition key definition) once up front, so the concurrent
+    # seed writes don't each stall on the same metadata fetch
+    container.read()
 
     return database, container
 
 
-def create_sample_projects() -> list[dict]:
-    """Generate sample project data"""
+# Sample project rows: (id, name, description, status, owner_id, created/updated offsets as
+# (days, hours) from now, tags, budget, due_date offset in days or None)
+SAMPLE_PROJECT_SPECS = (
+    (
+        "proj_apollo_001",
+        "Apollo Mission Control",
+        "Next-generation mission control system for space exploration",
+        "active",
+        "user_jane_doe",
+        (-30, 0),
+        (-5, 0),
+        ("space", "mission-critical", "real-time"),
+        2500000.0,
+        90,
+    ),
+    (
+        "proj_zephyr_002",
+        "Zephyr Wind Farm",
+        "Sustainable wind energy generation project",
+        "active",
+        "user_john_smith",
+        (-25, 0),
+        (-2, 0),
+        ("renewable", "energy", "sustainability"),
+        5000000.0,
+        180,
+    ),
+    (
+        "proj_hermes_003",
+        "Hermes Messaging Platform",
+        "Secure messaging platform for enterprise communications",
+        "archived",
+        "user_alice_brown",
+        (-120, 0),
+        (-60, 0),
+        ("communication", "security", "enterprise"),
+        750000.0,
+        None,
+    ),
+    (
+        "proj_orion_004",
+        "Orion Data Analytics",
+        "Advanced data analytics and visualization platform",
+        "draft",
+        "user_bob_wilson",
+        (-10, 0),
+        (-1, 0),
+        ("analytics", "data-science", "visualization"),
+        1200000.0,
+        120,
+    ),
+    (
+        "proj_helios_005",
+        "Helios Solar Initiative",
+        "Large-scale solar energy deployment across multiple sites",
+        "completed",
+        "user_mary_johnson",
+        (-200, 0),
+        (-30, 0),
+        ("solar", "renewable", "deployment"),
+        8000000.0,
+        None,
+    ),
+    (
+        "proj_artemis_006",
+        "Artemis AI Research",
+        "Cutting-edge artificial intelligence research and development",
+        "active",
+        "user_david_lee",
+        (-45, 0),
+        (-3, 0),
+        ("ai", "machine-learning", "research"),
+        3500000.0,
+        365,
+    ),
+    (
+        "proj_phoenix_007",
+        "Phoenix Cloud Migration",
+        "Complete infrastructure migration to cloud-native architecture",
+        "active",
+        "user_sarah_davis",
+        (-15, 0),
+        (0, 0),
+        ("cloud", "migration", "infrastructure"),
+        1800000.0,
+        150,
+    ),
+    (
+        "proj_titan_008",
+        "Titan Security Framework",
+        "Comprehensive cybersecurity framework for enterprise applications",
+        "draft",
+        "user_michael_chen",
+        (-5, 0),
+        (0, -12),
+        ("security", "framework", "cybersecurity"),
+        2200000.0,
+        200,
+    ),
+)
+
+
+@lru_cache(maxsize=1)
+def create_sample_projects() -> tuple[Mapping[str, Any], ...]:
+    """Generate sample project data once, as read-only mappings safe to share"""
     base_date = datetime.utcnow()
 
-    projects = [
-        {
-            "id": "proj_apollo_001",
-            "name": "Apollo Mission Control",
-            "description": "Next-generation mission control system for space exploration",
-            "status": "active",
-            "owner_id": "user_jane_doe",
-            "created_at": (base_date - timedelta(days=30)).isoformat(),
-            "updated_at": (base_date - timedelta(days=5)).isoformat(),
-            "tags": ["space", "mission-critical", "real-time"],
-            "budget": 2500000.0,
-            "due_date": (base_date + timedelta(days=90)).isoformat(),
-            "type": "project",
-        },
-        {
-            "id": "proj_zephyr_002",
-            "name": "Zephyr Wind Farm",
-            "description": "Sustainable wind energy generation project",
-            "status": "active",
-            "owner_id": "user_john_smith",
-            "created_at": (base_date - timedelta(days=25)).isoformat(),
-            "updated_at": (base_date - timedelta(days=2)).isoformat(),
-            "tags": ["renewable", "energy", "sustainability"],
-            "budget": 5000000.0,
-            "due_date": (base_date + timedelta(days=180)).isoformat(),
-            "type": "project",
-        },
-        {
-            "id": "proj_hermes_003",
-            "name": "Hermes Messaging Platform",
-            "description": "Secure messaging platform for enterprise communications",
-            "status": "archived",
-            "owner_id": "user_alice_brown",
-            "created_at": (base_date - timedelta(days=120)).isoformat(),
-            "updated_at": (base_date - timedelta(days=60)).isoformat(),
-            "tags": ["communication", "security", "enterprise"],
-            "budget": 750000.0,
-            "due_date": None,
-            "type": "project",
-        },
-        {
-            "id": "proj_orion_004",
-            "name": "Orion Data Analytics",
-            "description": "Advanced data analytics and visualization platform",
-            "status": "draft",
-            "owner_id": "user_bob_wilson",
-            "created_at": (base_date - timedelta(days=10)).isoformat(),
-            "updated_at": (base_date - timedelta(days=1)).isoformat(),
-            "tags": ["analytics", "data-science", "visualization"],
-            "budget": 1200000.0,
-            "due_date": (base_date + timedelta(days=120)).isoformat(),
-            "type": "project",
-        },
-        {
-            "id": "proj_helios_005",
-            "name": "Helios Solar Initiative",
-            "description": "Large-scale solar energy deployment across multiple sites",
-            "status": "completed",
-            "owner_id": "user_mary_johnson",
-            "created_at": (base_date - timedelta(days=200)).isoformat(),
-            "updated_at": (base_date - timedelta(days=30)).isoformat(),
-            "tags": ["solar", "renewable", "deployment"],
-            "budget": 8000000.0,
-            "due_date": None,
-            "type": "project",
-        },
-        {
-            "id": "proj_artemis_006",
-            "name": "Artemis AI Research",
-            "description": "Cutting-edge artificial intelligence research and development",
-            "status": "active",
-            "owner_id": "user_david_lee",
-            "created_at": (base_date - timedelta(days=45)).isoformat(),
-            "updated_at": (base_date - timedelta(days=3)).isoformat(),
-            "tags": ["ai", "machine-learning", "research"],
-            "budget": 3500000.0,
-            "due_date": (base_date + timedelta(days=365)).isoformat(),
-            "type": "project",
-        },
-        {
-            "id": "proj_phoenix_007",
-            "name": "Phoenix Cloud Migration",
-            "description": "Complete infrastructure migration to cloud-native architecture",
-            "status": "active",
-            "owner_id": "user_sarah_davis",
-            "created_at": (base_date - timedelta(days=15)).isoformat(),
-            "updated_at": base_date.isoformat(),
-            "tags": ["cloud", "migration", "infrastructure"],
-            "budget": 1800000.0,
-            "due_date": (base_date + timedelta(days=150)).isoformat(),
-            "type": "project",
-        },
-        {
-            "id": "proj_titan_008",
-            "name": "Titan Security Framework",
-            "description": "Comprehensive cybersecurity framework for enterprise applications",
-            "status": "draft",
-            "owner_id": "user_michael_chen",
-            "created_at": (base_date - timedelta(days=5)).isoformat(),
-            "updated_at": (base_date - timedelta(hours=12)).isoformat(),
-            "tags": ["security", "framework", "cybersecurity"],
-            "budget": 2200000.0,
-            "due_date": (base_date + timedelta(days=200)).isoformat(),
-            "type": "project",
-        },
-    ]
-
-    return projects
+    @cache
+    def iso(days: int = 0, hours: int = 0) -> str:
+        """ISO timestamp offset from base_date; repeated offsets are formatted once"""
+        return (base_date + timedelta(days=days, hours=hours)).isoformat()
+
+    return tuple(
+        MappingProxyType(
+            {
+                "id": project_id,
+                "name": name,
+                "description": description,
+                "status": status,
+                "owner_id": owner_id,
+                "created_at": iso(*created),
+                "updated_at": iso(*updated),
+                "tags": list(tags),
+                "budget": budget,
+                "due_date": None if due_days is None else iso(due_days),
+                "type": "project",
+                "name_lc": name.lower(),  # Index-friendly prefix search key
+            }
+        )
+        for (
+            project_id,
+            name,
+            description,
+            status,
+            owner_id,
+            created,
+            updated,
+            tags,
+            budget,
+            due_days,
+        ) in SAMPLE_PROJECT_SPECS
+    )
 
 
-def seed_projects(container, projects: list[dict]):
+def seed_projects(container, projects: Iterable[Mapping[str, Any]]):
     """Seed the container with sample projects"""
+    projects = [dict(project) for project in projects]  # Cosmos needs plain, JSON-ready dicts
     print(f"Seeding {len(projects)} sample projects...")
 
-    for project in projects:
-        try:
-            container.create_item(body=project)
-            print(f"✅ Created project: {project['name']}")
-        except CosmosResourceExistsError:
-            # Update existing project
-            container.replace_item(item=project["id"], body=project)
-            print(f"✅ Updated existing project: {project['name']}")
-        except Exception as e:
-            print(f"❌ Failed to create project {project['name']}: {e}")
-
-
-def create_indexes(container):
-    """Create additional indexes for better query performance"""
-    print("Setting up indexes for better query performance...")
+    # With /id partitioning every project is its own partition, so upsert each one and keep
+    # several in flight instead of paying one round trip each. Upserts insert or replace
+    # server-side, so re-runs need no create/replace fallback.
+    max_workers = max(1, min(SEED_MAX_WORKERS, len(projects)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(container.upsert_item, body=project): project for project in projects
+        }
+        for future in as_completed(futures):
+            project = futures[future]
+            try:
+                future.result()
+                print(f"✅ Upserted project: {project['name']}")
+            except Exception as e:
+                print(f"❌ Failed to create project {project['name']}: {e}")
+
+
+def query_count(container, query: str, parameters: list[dict] | None = None) -> int:
+    """Run a SELECT VALUE COUNT(1) query and return its scalar result"""
+    results = container.query_items(
+        query=query, parameters=parameters, enable_cross_partition_query=True, max_item_count=1
+    )
+    return next(iter(results), 0)
 
-    # Note: Cosmos DB automatically indexes all properties by default
-    # But we can create specific composite indexes for common query patterns
 
-    try:
-        # Read current indexing policy
-
-        # Update indexing policy (this requires container recreation in practice)
-        # For this demo, we'll just note that these would be beneficial
-        print(
-            "✅ Index recommendations noted (composite indexes would require container recreation)"
-        )
-
-    except Exception as e:
-        print(f"⚠️  Could not update indexes: {e}")
+def count_query_results(container, query: str, parameters: list[dict] | None = None) -> int:
+    """Count query results page by page without holding the full result set"""
+    pages = container.query_items(
+        query=query,
+        parameters=parameters,
+        enable_cross_partition_query=True,
+        max_item_count=QUERY_PAGE_SIZE,
+    ).by_page()
+    return sum(len(list(page)) for page in pages)
 
 
 def validate_setup(container):
@@ -216,74 +347,68 @@ def validate_setup(container):
     print("\nValidating setup...")
 
     try:
-        # Test basic query
-        query = "SELECT VALUE COUNT(1) FROM c WHERE c.type = 'project'"
-        results = list(container.query_items(query=query, enable_cross_partition_query=True))
-        project_count = results[0] if results else 0
-
-        print(f"✅ Found {project_count} projects in container")
+        # Total across every project, including any with a status outside the breakdown
+        project_count = query_count(
+            container, "SELECT VALUE COUNT(1) FROM c WHERE c.type = 'project'"
+        )
 
-        # FIXED: Use individual queries for status breakdown instead of GROUP BY
-        print("📊 Project status breakdown:")
-        statuses = ["active", "archived", "draft", "completed"]
+        # Per-status counts: the SDK cannot run cross-partition GROUP BY aggregates, so bind each
+        # status into one VALUE COUNT query instead
+        status_query = (
+            "SELECT VALUE COUNT(1) FROM c WHERE c.type = 'project' AND c.status = @status"
+        )
         status_summary = {}
-
-        for status in statuses:
-            status_query = (
-                f"SELECT VALUE COUNT(1) FROM c WHERE c.type = 'project' AND c.status = '{status}'"
-            )
-            status_results = list(
-                container.query_items(query=status_query, enable_cross_partition_query=True)
-            )
-            count = status_results[0] if status_results else 0
+        for status in ("active", "archived", "draft", "completed"):
+            count = query_count(container, status_query, [{"name": "@status", "value": status}])
             if count > 0:
                 status_summary[status] = count
-                print(f"   {status}: {count} projects")
 
-        # Test single project retrieval
-        single_project_query = "SELECT TOP 1 * FROM c WHERE c.type = 'project'"
-        single_result = list(
-            container.query_items(query=single_project_query, enable_cross_partition_query=True)
-        )
+        print(f"✅ Found {project_count} projects in container")
+        print("📊 Project status breakdown:")
+        for status, count in status_summary.items():
+            print(f"   {status}: {count} projects")
+
+        # Test single project retrieval with a 1 RU point read on a seeded id
+        try:
+            project = container.read_item(item=SAMPLE_PROJECT_ID, partition_key=SAMPLE_PROJECT_ID)
+        except CosmosResourceNotFoundError:
+            project = None
 
-        if single_result:
-            project = single_result[0]
+        if project:
             print(f"✅ Sample project: {project['name']} (Status: {project['status']})")
 
         # Test filtering queries
         print("\n🔍 Testing filtering capabilities:")
 
-        # Test name filtering
+        # Test name prefix filtering (range-index backed via the lowercase name_lc copy)
         name_filter_query = (
-            "SELECT * FROM c WHERE c.type = 'project' AND CONTAINS(UPPER(c.name), 'APOLLO')"
-        )
-        name_results = list(
-            container.query_items(query=name_filter_query, enable_cross_partition_query=True)
+            "SELECT VALUE COUNT(1) FROM c WHERE c.type = 'project' AND STARTSWITH(c.name_lc, @q)"
         )
-        print(f"   Name contains 'Apollo': {len(name_results)} results")
+        name_count = query_count(container, name_filter_query, [{"name": "@q", "value": "apollo"}])
+        print(f"   Name starts with 'Apollo': {name_count} results")
 
         # Test status filtering
-        status_filter_query = "SELECT * FROM c WHERE c.type = 'project' AND c.status = 'active'"
-        status_results = list(
-            container.query_items(query=status_filter_query, enable_cross_partition_query=True)
+        status_filter_query = (
+            "SELECT VALUE COUNT(1) FROM c WHERE c.type = 'project' AND c.status = @status"
         )
-        print(f"   Active projects: {len(status_results)} results")
+        status_count = query_count(
+            container, status_filter_query, [{"name": "@status", "value": "active"}]
+        )
+        print(f"   Active projects: {status_count} results")
 
         # Test tag filtering
         tag_filter_query = (
-            "SELECT * FROM c WHERE c.type = 'project' AND ARRAY_CONTAINS(c.tags, 'renewable')"
+            "SELECT VALUE COUNT(1) FROM c WHERE c.type = 'project' AND ARRAY_CONTAINS(c.tags, @tag)"
         )
-        tag_results = list(
-            container.query_items(query=tag_filter_query, enable_cross_partition_query=True)
+        tag_count = query_count(
+            container, tag_filter_query, [{"name": "@tag", "value": "renewable"}]
         )
-        print(f"   Projects with 'renewable' tag: {len(tag_results)} results")
+        print(f"   Projects with 'renewable' tag: {tag_count} results")
 
         # Test ordering
-        order_query = "SELECT c.id, c.name, c.created_at FROM c WHERE c.type = 'project' ORDER BY c.created_at DESC"
-        order_results = list(
-            container.query_items(query=order_query, enable_cross_partition_query=True)
-        )
-        print(f"   Ordered by created_at (DESC): {len(order_results)} results")
+        order_query = "SELECT c.id FROM c WHERE c.type = 'project' ORDER BY c.created_at DESC"
+        order_count = count_query_results(container, order_query)
+        print(f"   Ordered by created_at (DESC): {order_count} results")
 
         print("✅ All validation checks passed!")
 
@@ -296,30 +421,23 @@ def validate_setup(container):
 
 def print_connection_info():
     """Print connection information for reference"""
-    cosmos_uri = os.getenv("COSMOS_URI", "https://mseonepoc-cosmos.documents.azure.com:443/")
-    database_name = os.getenv("COSMOS_DB", "projectsdb")
-    container_name = os.getenv("COSMOS_CONTAINER", "projects")
-
-    print("\n" + "=" * 60)
-    print("COSMOS DB CONNECTION INFO")
-    print("=" * 60)
-    print(f"URI: {cosmos_uri}")
-    print(f"Database: {database_name}")
-    print(f"Container: {container_name}")
-    print("Partition Key: /id")
-    print("=" * 60)
+    rule = "=" * 60
+    sys.stdout.write(
+        f"\n{rule}\n"
+        "COSMOS DB CONNECTION INFO\n"
+        f"{rule}\n"
+        f"URI: {CONFIG.uri}\n"
+        f"Database: {CONFIG.database}\n"
+        f"Container: {CONFIG.container}\n"
+        f"Partition Key: {PARTITION_KEY_PATH}\n"
+        f"{rule}\n"
+    )
 
 
-def print_sample_queries():
-    """Print some sample queries for testing"""
-    print("\n" + "=" * 60)
-    print("SAMPLE GRAPHQL QUERIES FOR TESTING")
-    print("=" * 60)
-
-    queries = [
-        {
-            "name": "Get all projects (first 5)",
-            "query": """
+SAMPLE_QUERIES = [
+    {
+        "name": "Get all projects (first 5)",
+        "query": """
 query {
   projects(first: 5) {
     totalCount
@@ -339,10 +457,10 @@ query {
   }
 }
 """,
-        },
-        {
-            "name": "Filter by status",
-            "query": """
+    },
+    {
+        "name": "Filter by status",
+        "query": """
 query {
   projects(status: ACTIVE, first: 10) {
     totalCount
@@ -358,10 +476,10 @@ query {
   }
 }
 """,
-        },
-        {
-            "name": "Filter by name and tags",
-            "query": """
+    },
+    {
+        "name": "Filter by name and tags",
+        "query": """
 query {
   projects(nameContains: "Apollo", tags: ["space"], first: 5) {
     totalCount
@@ -379,10 +497,10 @@ query {
   }
 }
 """,
-        },
-        {
-            "name": "Create new project",
-            "query": """
+    },
+    {
+        "name": "Create new project",
+        "query": """
 mutation {
   createProject(input: {
     name: "New Test Project"
@@ -404,10 +522,10 @@ mutation {
   }
 }
 """,
-        },
-        {
-            "name": "Update existing project",
-            "query": """
+    },
+    {
+        "name": "Update existing project",
+        "query": """
 mutation {
   updateProject(
     id: "proj_apollo_001"
@@ -430,10 +548,10 @@ mutation {
   }
 }
 """,
-        },
-        {
-            "name": "Get project summary",
-            "query": """
+    },
+    {
+        "name": "Get project summary",
+        "query": """
 query {
   projectSummary {
     totalProjects
@@ -444,10 +562,10 @@ query {
   }
 }
 """,
-        },
-        {
-            "name": "Pagination example",
-            "query": """
+    },
+    {
+        "name": "Pagination example",
+        "query": """
 query {
   projects(
     first: 3
@@ -477,22 +595,29 @@ query {
 #   }
 # }
 """,
-        },
+    },
+]
+
+# Rendered once at import so printing is a single write
+SAMPLE_QUERIES_TEXT = "\n".join(
+    [
+        "\n" + "=" * 60,
+        "SAMPLE GRAPHQL QUERIES FOR TESTING",
+        "=" * 60,
+        *(
+            f"\n{i}. {query['name']}:\n{query['query']}"
+            for i, query in enumerate(SAMPLE_QUERIES, 1)
+        ),
+        "=" * 60,
+        "",
     ]
+)
 
-    for i, query in enumerate(queries, 1):
-        print(f"\n{i}. {query['name']}:")
-        print(query["query"])
-
-    print("=" * 60)
-
-
-def print_curl_examples():
-    """Print curl examples for testing the API"""
-    print("\n" + "=" * 60)
-    print("CURL EXAMPLES FOR API TESTING")
-    print("=" * 60)
-    print(
+CURL_EXAMPLES_TEXT = "\n".join(
+    [
+        "\n" + "=" * 60,
+        "CURL EXAMPLES FOR API TESTING",
+        "=" * 60,
         """
 # Health check (no auth required)
 curl -X GET http://localhost:8001/healthz
@@ -520,13 +645,38 @@ curl -X POST http://localhost:8001/graphql \
   -d '{
     "query": "{ project(id: \\"proj_apollo_001\\") { id name status description budget tags } }"
   }'
-"""
+""",
+        "=" * 60,
+        "",
+    ]
+)
+
+
+def print_sample_queries():
+    """Print some sample queries for testing"""
+    sys.stdout.write(SAMPLE_QUERIES_TEXT)
+
+
+def print_curl_examples():
+    """Print curl examples for testing the API"""
+    sys.stdout.write(CURL_EXAMPLES_TEXT)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Create and seed the mseONE PoC Cosmos DB")
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="also print sample GraphQL queries and curl examples",
     )
-    print("=" * 60)
+    return parser.parse_args(argv)
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Main setup function"""
+    args = parse_args(argv)
+
     print("mseONE PoC - Cosmos DB Setup Script")
     print("=" * 60)
 
@@ -553,12 +703,6 @@ def main():
         print(f"❌ Failed to seed data: {e}")
         sys.exit(1)
 
-    # Setup indexes
-    try:
-        create_indexes(container)
-    except Exception as e:
-        print(f"⚠️  Warning: Failed to setup indexes: {e}")
-
     # Validate setup
     if not validate_setup(container):
         print("❌ Setup validation failed!")
@@ -566,15 +710,19 @@ def main():
 
     # Print helpful information
     print_connection_info()
-    print_sample_queries()
-    print_curl_examples()
+    if args.verbose:
+        print_sample_queries()
+        print_curl_examples()
 
     print("\n🎉 Setup completed successfully!")
     print("Your API should now be able to query the seeded data.")
     print("\nNext steps:")
     print("1. Start your FastAPI server: uvicorn api.main:app --host 0.0.0.0 --port 8001 --reload")
     print("2. Open GraphQL Playground: http://localhost:8001/graphql")
-    print("3. Try the sample queries above!")
+    if args.verbose:
+        print("3. Try the sample queries above!")
+    else:
+        print("3. Try the sample queries (rerun with --verbose to print them)!")
 
 
 if __name__ == "__main__":
@@ -1,25 +1,30 @@
 # tests/conftest.py - Updated with proper base64 key
 import base64
 import os
+from types import MappingProxyType
 
 import pytest
+import pytest_asyncio
 
-# Generate a proper fake base64 key for testing
-fake_cosmos_key = base64.b64encode(b"fake_cosmos_key_for_testing_purposes_123456").decode("ascii")
+# Generate proper fake base64 keys for testing, once per session
+_COSMOS_KEY = base64.b64encode(b"fake_cosmos_key_for_testing_purposes_123456").decode("ascii")
+_STORAGE_KEY = base64.b64encode(b"fake_storage_key_for_testing").decode("ascii")
 
-# Set environment variables BEFORE any imports that might read them
-os.environ.update(
+_TEST_ENV = MappingProxyType(
     {
         "APP_ENV": "local",
         "COSMOS_URI": "https://test.documents.azure.com:443/",
-        "COSMOS_KEY": fake_cosmos_key,  # Proper base64 encoded key
+        "COSMOS_KEY": _COSMOS_KEY,  # Proper base64 encoded key
         "COSMOS_DB": "testdb",
         "COSMOS_CONTAINER": "testcontainer",
         "STORAGE_ACCOUNT": "testaccount",
-        "STORAGE_KEY": base64.b64encode(b"fake_storage_key_for_testing").decode("ascii"),
+        "STORAGE_KEY": _STORAGE_KEY,
     }
 )
 
+# Set environment variables BEFORE any imports that might read them
+os.environ.update(_TEST_ENV)
+
 
 # Now the fixture for cleanup
 @pytest.fixture(scope="session", autouse=True)
@@ -28,17 +33,7 @@ def setup_test_environment():
     original_env = os.environ.copy()
 
     # Ensure these are set with proper base64 encoding
-    test_env = {
-        "APP_ENV": "local",
-        "COSMOS_URI": "https://test.documents.azure.com:443/",
-        "COSMOS_KEY": fake_cosmos_key,
-        "COSMOS_DB": "testdb",
-        "COSMOS_CONTAINER": "testcontainer",
-        "STORAGE_ACCOUNT": "testaccount",
-        "STORAGE_KEY": base64.b64encode(b"fake_storage_key_for_testing").decode("ascii"),
-    }
-
-    os.environ.update(test_env)
+    os.environ.update(_TEST_ENV)
 
     yield
 
@@ -47,24 +42,129 @@ def setup_test_environment():
     os.environ.update(original_env)
 
 
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole session, so app startup and shutdown run once"""
+    from fastapi.testclient import TestClient
+
+    from api.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient():
+    """Async client over ASGI for tests that send several requests concurrently"""
+    import httpx
+
+    from api.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest.fixture(scope="session")
+def cosmos_client():
+    """One mocked CosmosClient shared by every repository built during the session"""
+    from unittest.mock import MagicMock
+
+    client = MagicMock()
+    # The monkeypatch fixture is function-scoped, so drive a session-long MonkeyPatch directly
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("api.repositories.projects.get_cosmos_client", lambda *a, **k: client)
+        yield client
+
+
+class StubProjectRepository:
+    """Plain stand-in for ProjectRepository; tests assign the canned results they need"""
+
+    def __init__(self):
+        self.calls: list[str] = []  # Repository methods called, in order
+        self.project = None
+        self.page: tuple[list, bool] = ([], False)
+        self.count = 0
+        self.summary: dict[str, int] = {}
+        self.on_create = None  # Called with the CreateProjectRequest; may raise
+
+    def get_by_id(self, project_id):
+        self.calls.append("get_by_id")
+        return self.project
+
+    def get_project_count(self, **filters):
+        self.calls.append("get_project_count")
+        return self.count
+
+    def list_projects(self, **kwargs):
+        self.calls.append("list_projects")
+        return self.page
+
+    def get_projects_by_status_summary(self):
+        self.calls.append("get_projects_by_status_summary")
+        return self.summary
+
+    def create_project(self, request):
+        self.calls.append("create_project")
+        return self.on_create(request)
+
+
+class StubStorageService:
+    """Plain stand-in for StorageService that keeps saved results in memory"""
+
+    def __init__(self):
+        self.saved: list[dict] = []
+
+    def save_result(self, payload):
+        self.saved.append(payload)
+        return "fake-blob-name"
+
+
+@pytest.fixture
+def stub_repo(monkeypatch):
+    """Stub ProjectRepository handed to the GraphQL resolvers"""
+    repo = StubProjectRepository()
+    monkeypatch.setattr("api.graphql.schema.ProjectRepository", lambda *a, **k: repo)
+    return repo
+
+
 @pytest.fixture
-def mock_cosmos_repo():
-    """Mock the ProjectRepository to avoid real Cosmos DB connections"""
-    from unittest.mock import MagicMock, patch
+def stub_storage(monkeypatch):
+    """Stub StorageService handed to the GraphQL resolvers"""
+    storage = StubStorageService()
+    monkeypatch.setattr("api.graphql.schema.StorageService", lambda *a, **k: storage)
+    return storage
 
-    with patch("api.repositories.projects.ProjectRepository") as mock_repo_class:
-        mock_repo = MagicMock()
-        mock_repo_class.return_value = mock_repo
-        yield mock_repo
+
+@pytest.fixture(scope="session")
+def project_record_template():
+    """ProjectRecord built once; tests derive their records from it"""
+    from datetime import datetime
+
+    from api.repositories.projects import ProjectRecord, ProjectStatus
+
+    fixed_now = datetime(2024, 1, 1, 0, 0, 0)  # No test asserts on timestamps
+    return ProjectRecord(
+        id="proj_123",
+        name="Test Project",
+        description=None,
+        status=ProjectStatus.DRAFT,
+        owner_id=None,
+        created_at=fixed_now,
+        updated_at=fixed_now,
+        tags=[],
+        budget=None,
+        due_date=None,
+    )
 
 
 @pytest.fixture
-def mock_storage_service():
-    """Mock the StorageService to avoid real Azure Storage connections"""
-    from unittest.mock import MagicMock, patch
-
-    with patch("api.services.storage.StorageService") as mock_storage_class:
-        mock_storage = MagicMock()
-        mock_storage.return_value.save_result.return_value = "fake-blob-name"
-        mock_storage_class.return_value = mock_storage
-        yield mock_storage
+def make_project_record(project_record_template):
+    """Factory returning a copy of the template record with fields overridden"""
+    from dataclasses import replace
+
+    def make(**overrides):
+        # Fresh tags list so tests never share the template's mutable default
+        return replace(project_record_template, **{"tags": [], **overrides})
+
+    return make
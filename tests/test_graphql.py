@@ -1,271 +1,282 @@
-from datetime import datetime
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import MagicMock
 
-from fastapi.testclient import TestClient
+import orjson
+import pytest
+from graphql import GraphQLSyntaxError, parse, validate
 
 from api.auth import LOCAL_DEV_TOKEN
-from api.main import app
+from api.graphql.schema import schema
 from api.repositories.projects import ProjectStatus
 
-
-# Helper function to get auth headers
-def get_auth_headers():
-    return {"Authorization": f"Bearer {LOCAL_DEV_TOKEN}"}
-
-
-client = TestClient(app)
-
-
-class TestHealthEndpoint:
-    @patch("api.repositories.projects.ProjectRepository")
-    @patch("api.services.storage.StorageService")
-    def test_healthz(self, mock_storage_class, mock_repo_class):
-        """Test health endpoint"""
-        # Configure mocks
-        mock_repo_class.return_value = MagicMock()
-        mock_storage_class.return_value = MagicMock()
-
-        r = client.get("/healthz")
-        assert r.status_code == 200
-        response_data = r.json()
-        assert "status" in response_data
-        assert response_data["status"] in ["ok", "degraded"]
+# Headers for orjson-encoded bodies, built once at import; only needed for HTTP tests
+_JSON = {"Content-Type": "application/json"}
+_AUTH = {"Authorization": f"Bearer {LOCAL_DEV_TOKEN}"} | _JSON
+
+# Single-line documents: no indentation for the lexer to skip or the client to send
+_Q_PROJECT_BY_ID = "query($id: ID!) { project(id: $id) { id name status } }"
+
+_Q_PROJECTS_LIST = (
+    "query($first: Int!) { projects(first: $first) {"
+    " totalCount edges { cursor node { id } } pageInfo { hasNextPage endCursor } } }"
+)
+
+_Q_PROJECT_SUMMARY = (
+    "{ projectSummary { totalProjects activeProjects archivedProjects"
+    " draftProjects completedProjects } }"
+)
+
+_Q_CREATE_PROJECT = (
+    "mutation($input: CreateProjectInput!) { createProject(input: $input) {"
+    " success error project { id name status description tags ownerId budget dueDate } } }"
+)
+
+_Q_CREATE_PROJECT_RESULT = (
+    "mutation($input: CreateProjectInput!) { createProject(input: $input) {"
+    " success error project { id } } }"
+)
+
+
+# Expected responses for read-only queries against fixed mock data
+_GOLDEN_EMPTY_PROJECTS = {
+    "projects": {
+        "totalCount": 0,
+        "edges": [],
+        "pageInfo": {"hasNextPage": False, "endCursor": None},
+    }
+}
+
+_GOLDEN_SUMMARY = {
+    "projectSummary": {
+        "totalProjects": 7,
+        "activeProjects": 2,
+        "archivedProjects": 1,
+        "draftProjects": 3,
+        "completedProjects": 1,
+    }
+}
+
+
+def post_gql(client, body, headers=_AUTH):
+    """POST a GraphQL body to the app, encoded with orjson"""
+    return client.post("/graphql", content=orjson.dumps(body), headers=headers)
+
+
+def gql_ok(query: str, variables: dict | None = None) -> dict:
+    """Execute a document in-process (no HTTP, ASGI or auth) and return its data"""
+    result = schema.execute_sync(query, variable_values=variables)
+    assert result.errors is None, result.errors
+    return result.data
+
+
+@pytest.fixture(scope="session")
+def schema_types():
+    """Schema types by name, introspected once per session"""
+    return {t["name"]: t for t in schema.introspect()["__schema"]["types"]}
+
+
+class TestSchemaShape:
+    @pytest.mark.parametrize(
+        ("type_name", "fields"),
+        [
+            ("ProjectConnection", {"totalCount", "edges", "pageInfo"}),
+            ("ProjectEdge", {"cursor", "node"}),
+            ("PageInfo", {"hasNextPage", "endCursor"}),
+        ],
+    )
+    def test_connection_types_expose_fields(self, schema_types, type_name, fields):
+        """Test the pagination types keep the fields clients rely on"""
+        assert fields <= {field["name"] for field in schema_types[type_name]["fields"]}
 
 
 class TestProjectQueries:
-    def test_graphql_requires_auth(self):
-        """Test that GraphQL requires authentication"""
-        q = {"query": '{ project(id: "1") { id name status } }'}
-        r = client.post("/graphql", json=q)  # no auth
-        assert r.status_code == 401
-
-    @patch("api.graphql.schema.ProjectRepository")
-    @patch("api.graphql.schema.StorageService")
-    def test_project_query_not_found(self, mock_storage_class, mock_repo_class):
-        """Test querying non-existent project"""
-        # Configure mocks
-        mock_repo = MagicMock()
-        mock_repo.get_by_id.return_value = None
-        mock_repo_class.return_value = mock_repo
-
-        mock_storage = MagicMock()
-        mock_storage.save_result.return_value = "fake-blob-name"
-        mock_storage_class.return_value = mock_storage
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_graphql_requires_auth(self, aclient):
+        """Test that GraphQL rejects missing and invalid tokens"""
+        body = orjson.dumps({"query": _Q_PROJECT_BY_ID, "variables": {"id": "1"}})
+        # Independent requests, so send them concurrently
+        missing, invalid = await asyncio.gather(
+            aclient.post("/graphql", content=body, headers=_JSON),
+            aclient.post(
+                "/graphql", content=body, headers={"Authorization": "Bearer wrong"} | _JSON
+            ),
+        )
+        assert missing.status_code == 401
+        assert invalid.status_code == 401
 
-        q = {"query": '{ project(id: "nonexistent") { id name status } }'}
-        r = client.post("/graphql", json=q, headers=get_auth_headers())
-        assert r.status_code == 200
-        data = r.json()
-        assert data["data"]["project"] is None
+    def test_project_query_not_found(self, stub_repo, stub_storage):
+        """Test querying non-existent project"""
+        # Stub repository finds no project by default
+        assert gql_ok(_Q_PROJECT_BY_ID, {"id": "nonexistent"})["project"] is None
+        assert stub_repo.calls == ["get_by_id"]  # One point read
 
-    @patch("api.graphql.schema.ProjectRepository")
-    @patch("api.graphql.schema.StorageService")
-    def test_projects_list_empty(self, mock_storage_class, mock_repo_class):
+    def test_projects_list_empty(self, stub_repo, stub_storage):
         """Test listing projects when none exist or filters return empty"""
-        # Configure mocks
-        mock_repo = MagicMock()
-        mock_repo.list_projects.return_value = ([], False)  # empty list, no next page
-        mock_repo.get_project_count.return_value = 0
-        mock_repo_class.return_value = mock_repo
-
-        mock_storage = MagicMock()
-        mock_storage.save_result.return_value = "fake-blob-name"
-        mock_storage_class.return_value = mock_storage
-
-        q = {
-            "query": """
-            query($first: Int!) {
-                projects(first: $first) {
-                    totalCount
-                    edges { cursor node { id name status } }
-                    pageInfo { hasNextPage endCursor }
-                }
-            }
-            """,
-            "variables": {"first": 10},
-        }
-        r = client.post("/graphql", json=q, headers=get_auth_headers())
-        assert r.status_code == 200
-        data = r.json()["data"]["projects"]
-        assert data["totalCount"] == 0
-        assert isinstance(data["edges"], list)
-        assert "pageInfo" in data
-
-    @patch("api.graphql.schema.ProjectRepository")
-    @patch("api.graphql.schema.StorageService")
-    def test_project_summary(self, mock_storage_class, mock_repo_class):
+        # Stub repository counts no projects by default
+        assert gql_ok(_Q_PROJECTS_LIST, {"first": 10}) == _GOLDEN_EMPTY_PROJECTS
+        assert stub_repo.calls == ["get_project_count"]  # Empty count skips the SELECT
+
+    def test_projects_list_with_results(self, stub_repo, stub_storage, make_project_record):
+        """Test listing projects when the count reports matches"""
+        project = make_project_record(name="Listed Project", status=ProjectStatus.ACTIVE)
+
+        # Configure stubs
+        stub_repo.page = ([project], False)
+        stub_repo.count = 1
+
+        data = gql_ok(_Q_PROJECTS_LIST, {"first": 10})["projects"]
+        assert data["totalCount"] == 1
+        assert [edge["node"]["id"] for edge in data["edges"]] == ["proj_123"]
+        assert data["pageInfo"]["endCursor"] == data["edges"][0]["cursor"]
+        # One page costs exactly the count query plus the page query
+        assert stub_repo.calls == ["get_project_count", "list_projects"]
+
+    def test_project_summary(self, stub_repo, stub_storage):
         """Test project summary query"""
-        # Configure mocks
-        mock_repo = MagicMock()
-        mock_repo.get_projects_by_status_summary.return_value = {
+        # Configure stubs
+        stub_repo.summary = {
             "active": 2,
             "archived": 1,
             "draft": 3,
             "completed": 1,
         }
-        mock_repo_class.return_value = mock_repo
-
-        mock_storage = MagicMock()
-        mock_storage.save_result.return_value = "fake-blob-name"
-        mock_storage_class.return_value = mock_storage
-
-        q = {
-            "query": """
-            {
-                projectSummary {
-                    totalProjects
-                    activeProjects
-                    archivedProjects
-                    draftProjects
-                    completedProjects
-                }
-            }
-            """
-        }
-        r = client.post("/graphql", json=q, headers=get_auth_headers())
-        assert r.status_code == 200
-        data = r.json()["data"]["projectSummary"]
-        assert "totalProjects" in data
-        assert data["totalProjects"] == 7  # sum of all statuses
 
+        # totalProjects is the sum of all statuses
+        assert gql_ok(_Q_PROJECT_SUMMARY) == _GOLDEN_SUMMARY
+        assert stub_repo.calls == ["get_projects_by_status_summary"]
 
-class TestProjectMutations:
-    @patch("api.graphql.schema.ProjectRepository")
-    @patch("api.graphql.schema.StorageService")
-    def test_create_project_minimal(self, mock_storage_class, mock_repo_class):
-        """Test creating project with minimal required fields"""
-        from api.repositories.projects import ProjectRecord
-
-        # Create a mock project record
-        mock_project = ProjectRecord(
-            id="proj_123",
-            name="Test Project Minimal",
-            description=None,
-            status=ProjectStatus.DRAFT,
-            owner_id=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            tags=[],
-            budget=None,
-            due_date=None,
-        )
-
-        # Configure mocks
-        mock_repo = MagicMock()
-        mock_repo.create_project.return_value = mock_project
-        mock_repo_class.return_value = mock_repo
-
-        mock_storage = MagicMock()
-        mock_storage.save_result.return_value = "fake-blob-name"
-        mock_storage_class.return_value = mock_storage
-
-        mutation = {
-            "query": """
-            mutation($input: CreateProjectInput!) {
-                createProject(input: $input) {
-                    success
-                    error
-                    project {
-                        id
-                        name
-                        status
-                        description
-                        tags
-                        createdAt
-                        updatedAt
-                    }
-                }
-            }
-            """,
-            "variables": {"input": {"name": "Test Project Minimal"}},
-        }
+    def test_batched_queries_share_one_request(self, stub_repo, stub_storage, client):
+        """Test independent operations sent as a JSON array come back as a list of results"""
+        stub_repo.summary = {"active": 2}
 
-        r = client.post("/graphql", json=mutation, headers=get_auth_headers())
+        batch = [
+            {"query": _Q_PROJECT_BY_ID, "variables": {"id": "nonexistent"}},
+            {"query": _Q_PROJECT_SUMMARY},
+        ]
+        r = post_gql(client, batch)
         assert r.status_code == 200
+        project_result, summary_result = orjson.loads(r.content)
+        assert project_result["data"]["project"] is None
+        assert summary_result["data"]["projectSummary"]["totalProjects"] == 2
+
 
-        response_data = r.json()
-        assert "data" in response_data
-        data = response_data["data"]["createProject"]
+class TestProjectMutations:
+    @pytest.mark.parametrize(
+        ("project_input", "expected"),
+        [
+            pytest.param(
+                {"name": "Test Project Minimal"},
+                {
+                    "name": "Test Project Minimal",
+                    "status": "DRAFT",  # Default status
+                    "description": None,
+                    "tags": [],
+                    "ownerId": None,
+                    "budget": None,
+                    "dueDate": None,
+                },
+                id="minimal",
+            ),
+            pytest.param(
+                {
+                    "name": "Test Project Full",
+                    "description": "Every optional field set",
+                    "status": "ACTIVE",
+                    "tags": ["space", "research"],
+                    "ownerId": "user_42",
+                    "budget": 125000.5,
+                    "dueDate": "2025-12-31T00:00:00Z",
+                },
+                {
+                    "name": "Test Project Full",
+                    "status": "ACTIVE",
+                    "description": "Every optional field set",
+                    "tags": ["space", "research"],
+                    "ownerId": "user_42",
+                    "budget": 125000.5,
+                    "dueDate": "2025-12-31T00:00:00+00:00",  # Z is normalized to an offset
+                },
+                id="full",
+            ),
+        ],
+    )
+    def test_create_project(
+        self, stub_repo, stub_storage, make_project_record, project_input, expected
+    ):
+        """Test creating projects from minimal and fully specified inputs"""
+
+        def create_project(request):
+            return make_project_record(
+                name=request.name,
+                description=request.description,
+                status=request.status,
+                owner_id=request.owner_id,
+                tags=request.tags,
+                budget=request.budget,
+                due_date=request.due_date,
+            )
+
+        # Configure stubs
+        stub_repo.on_create = create_project
+
+        data = gql_ok(_Q_CREATE_PROJECT, {"input": project_input})["createProject"]
         assert data["success"] is True
         assert data["error"] is None
-        assert data["project"] is not None
-
-        project = data["project"]
-        assert project["name"] == "Test Project Minimal"
-        assert project["status"] == "DRAFT"  # Default status
-        assert project["description"] is None
-        assert project["tags"] == []
+        assert data["project"] == {"id": "proj_123", **expected}
+        assert len(stub_storage.saved) == 1
 
-    @patch("api.graphql.schema.ProjectRepository")
-    @patch("api.graphql.schema.StorageService")
-    def test_create_project_validation_error(self, mock_storage_class, mock_repo_class):
+    def test_create_project_validation_error(self, stub_repo, stub_storage):
         """Test creating project with validation error"""
-        # Configure mocks
-        mock_repo = MagicMock()
-        mock_repo.create_project.side_effect = ValueError("Project name cannot be empty")
-        mock_repo_class.return_value = mock_repo
-
-        mock_storage = MagicMock()
-        mock_storage.save_result.return_value = "fake-blob-name"
-        mock_storage_class.return_value = mock_storage
-
-        mutation = {
-            "query": """
-            mutation($input: CreateProjectInput!) {
-                createProject(input: $input) {
-                    success
-                    error
-                    project {
-                        id
-                        name
-                    }
-                }
-            }
-            """,
-            "variables": {"input": {"name": ""}},  # Empty name should cause validation error
-        }
-
-        r = client.post("/graphql", json=mutation, headers=get_auth_headers())
-        assert r.status_code == 200
+        # Configure stubs
+        stub_repo.on_create = MagicMock(side_effect=ValueError("Project name cannot be empty"))
 
-        response_data = r.json()
-        assert "data" in response_data
-        data = response_data["data"]["createProject"]
+        # Empty name should cause validation error
+        data = gql_ok(_Q_CREATE_PROJECT_RESULT, {"input": {"name": ""}})["createProject"]
         assert data["success"] is False
         assert "Project name cannot be empty" in data["error"]
         assert data["project"] is None
 
 
-class TestErrorHandling:
-    def test_malformed_graphql_query(self):
-        """Test handling of malformed GraphQL queries"""
-        malformed_query = {"query": "{ malformed query without proper syntax"}
-
-        r = client.post("/graphql", json=malformed_query, headers=get_auth_headers())
-        # GraphQL returns errors in the response body, not status codes
-        assert r.status_code == 200
-        data = r.json()
-        assert "errors" in data
-        assert any("Syntax Error" in str(error) for error in data["errors"])
-
-    def test_invalid_field_query(self):
-        """Test querying for non-existent fields"""
-        invalid_query = {"query": '{ project(id: "1") { id name nonExistentField } }'}
-
-        r = client.post("/graphql", json=invalid_query, headers=get_auth_headers())
-        # GraphQL returns errors in response body, not status codes
-        assert r.status_code == 200
-        data = r.json()
-        assert "errors" in data
-        assert any("Cannot query field" in str(error) for error in data["errors"])
+@pytest.fixture(scope="session")
+def graphql_schema():
+    """The graphql-core schema Strawberry executes against, for parse/validate-only tests"""
+    return schema._schema
 
 
-# Simple test for the basic health endpoint
-class TestBasicHealth:
-    def test_root_endpoint(self):
-        """Test root endpoint"""
-        r = client.get("/")
+class TestErrorHandling:
+    @pytest.mark.parametrize(
+        ("query", "message"),
+        [
+            pytest.param("{ malformed query without proper syntax", "Syntax Error", id="malformed"),
+            pytest.param(
+                '{ project(id: "1") { id name nonExistentField } }',
+                "Cannot query field",
+                id="invalid_field",
+            ),
+        ],
+    )
+    def test_invalid_document_is_rejected(self, graphql_schema, query, message):
+        """Test malformed syntax and unknown fields are reported before execution"""
+        try:
+            errors = validate(graphql_schema, parse(query))
+        except GraphQLSyntaxError as e:
+            errors = [e]
+        assert any(message in error.message for error in errors)
+
+    def test_invalid_document_over_http(self, stub_repo, stub_storage, client):
+        """Test an unknown field comes back over HTTP as a 200 with errors and no data"""
+        r = post_gql(client, {"query": '{ project(id: "1") { id name nonExistentField } }'})
         assert r.status_code == 200
-        data = r.json()
-        assert "message" in data
-        assert "mseONE PoC API" in data["message"]
+        body = orjson.loads(r.content)
+        assert body["data"] is None
+        assert any("Cannot query field" in error["message"] for error in body["errors"])
+        assert stub_repo.calls == []
+
+    def test_deeply_nested_body_is_rejected(self, stub_repo, stub_storage, client):
+        """Test a pathologically nested request body fails cleanly instead of crashing the worker"""
+        depth = 200_000
+        body = b'{"query": "{ projectSummary { totalProjects } }", "variables": {"a": '
+        body += b"[" * depth + b"]" * depth + b"}}"
+        r = client.post("/graphql", content=body, headers=_AUTH)
+        assert r.status_code == 400
+        assert stub_repo.calls == []
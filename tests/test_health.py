@@ -1,47 +1,52 @@
-import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
-from fastapi.testclient import TestClient
+import pytest
 
-from api.main import app
 
-client = TestClient(app)
-
-
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test root endpoint"""
     response = client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert "message" in data
     assert "mseONE PoC API" in data["message"]
-
-
-def test_healthz_endpoint():
-    """Test health endpoint with mocked dependencies"""
+    assert data["graphql_endpoint"] == "/graphql"
+
+
+@pytest.mark.parametrize(
+    ("repo_error", "read_error", "expected_status", "expected_connection"),
+    [
+        (None, None, "ok", "ok"),
+        (RuntimeError("cosmos unreachable"), None, "degraded", "error: cosmos unreachable"),
+        (None, RuntimeError("container gone"), "degraded", "error: container gone"),
+    ],
+    ids=["ok", "degraded", "degraded_after_connect"],
+)
+def test_healthz_endpoint(
+    client, monkeypatch, repo_error, read_error, expected_status, expected_connection
+):
+    """Test health endpoint with mocked dependencies, healthy and with Cosmos failing"""
     # Mock environment variables to avoid real Azure connections
-    with patch.dict(
-        os.environ,
-        {"APP_ENV": "local", "COSMOS_KEY": "fake_key", "STORAGE_KEY": "fake_storage_key"},
-    ):
-        # Mock the repository and storage service classes
-        with (
-            patch("api.repositories.projects.ProjectRepository") as mock_repo_class,
-            patch("api.services.storage.StorageService") as mock_storage_class,
-        ):
-
-            # Configure the mocks to return successful instances
-            mock_repo = MagicMock()
-            mock_repo_class.return_value = mock_repo
-
-            mock_storage = MagicMock()
-            mock_storage_class.return_value = mock_storage
-
-            # Make the health check request
-            response = client.get("/healthz")
-            assert response.status_code == 200
-
-            data = response.json()
-            assert "status" in data
-            assert data["status"] in ["ok", "degraded"]
-            assert "environment" in data
+    monkeypatch.setenv("APP_ENV", "local")
+    monkeypatch.setenv("COSMOS_KEY", "fake_key")
+    monkeypatch.setenv("STORAGE_KEY", "fake_storage_key")
+
+    # Mock the repository class; failing to construct it, or to read the container through
+    # an already-cached client, marks the service degraded
+    def repository():
+        if repo_error:
+            raise repo_error
+        repo = MagicMock()
+        repo.container.read.side_effect = read_error
+        return repo
+
+    monkeypatch.setattr("api.repositories.projects.ProjectRepository", repository)
+
+    # Make the health check request
+    response = client.get("/healthz")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["status"] == expected_status
+    assert data["cosmos_connection"] == expected_connection
+    assert data["environment"] == "local"
@@ -0,0 +1,202 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from api.repositories.projects import (
+    CreateProjectRequest,
+    ProjectRecord,
+    ProjectRepository,
+    ProjectStatus,
+    get_cosmos_client,
+)
+
+
+@pytest.fixture
+def repo(cosmos_client):
+    """ProjectRepository wired to a fresh mocked Cosmos container"""
+    repository = ProjectRepository()
+    repository.container = MagicMock()
+    return repository
+
+
+class TestProjectRecord:
+    def test_from_dict_round_trips_to_dict(self):
+        """Test a record survives serialization to and from a Cosmos document"""
+        record = ProjectRecord(
+            id="proj_1",
+            name="Apollo",
+            description="Mission control",
+            status=ProjectStatus.ACTIVE,
+            owner_id="user_1",
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 2),
+            tags=["space"],
+            budget=10.0,
+            due_date=datetime(2024, 6, 1),
+        )
+
+        assert ProjectRecord.from_dict(record.to_dict()) == record
+
+    def test_from_dict_defaults_optional_fields(self):
+        """Test missing or null optional fields fall back to defaults"""
+        record = ProjectRecord.from_dict(
+            {
+                "id": "proj_1",
+                "name": "Apollo",
+                "status": "draft",
+                "created_at": "2024-01-01T00:00:00",
+                "updated_at": "2024-01-01T00:00:00",
+                "tags": None,
+            }
+        )
+
+        assert record.status is ProjectStatus.DRAFT
+        assert record.tags == []
+        assert record.description is None
+        assert record.due_date is None
+
+
+class TestClientReuse:
+    def test_repositories_share_one_client(self, cosmos_client):
+        """Test every repository instance reuses the session CosmosClient"""
+        assert ProjectRepository().client is ProjectRepository().client is cosmos_client
+
+    def test_get_cosmos_client_is_memoized(self, monkeypatch):
+        """Test the real client factory builds one client per connection settings"""
+        client_class = MagicMock()
+        monkeypatch.setattr("api.repositories.projects.CosmosClient", client_class)
+        get_cosmos_client.cache_clear()
+        try:
+            first = get_cosmos_client("https://example", "key")
+            second = get_cosmos_client("https://example", "key")
+            assert first is second
+            client_class.assert_called_once_with(
+                "https://example", credential="key", preferred_locations=[]
+            )
+        finally:
+            get_cosmos_client.cache_clear()
+
+
+class TestCreateProjectsBulk:
+    def test_creates_every_project_with_unique_ids(self, repo):
+        """Test bulk create writes each project once with distinct IDs"""
+        requests = [CreateProjectRequest(name=f"Project {i}") for i in range(3)]
+
+        projects = repo.create_projects_bulk(requests)
+
+        assert [p.name for p in projects] == ["Project 0", "Project 1", "Project 2"]
+        assert len({p.id for p in projects}) == 3
+        assert repo.container.create_item.call_count == 3
+
+    def test_validation_error_prevents_any_write(self, repo):
+        """Test an invalid request rejects the whole bulk before writing"""
+        requests = [CreateProjectRequest(name="Valid"), CreateProjectRequest(name="  ")]
+
+        with pytest.raises(ValueError, match="Project name cannot be empty"):
+            repo.create_projects_bulk(requests)
+
+        repo.container.create_item.assert_not_called()
+
+    def test_failure_reports_projects_already_created(self, repo):
+        """Test a failed write names the projects that were persisted before it"""
+        repo.container.create_item.side_effect = [None, RuntimeError("throttled")]
+        requests = [CreateProjectRequest(name=f"P{i}") for i in range(2)]
+
+        with pytest.raises(RuntimeError, match=r"already created: proj_\d+_[0-9a-f]{12}\)"):
+            repo.create_projects_bulk(requests)
+
+
+def _doc(i: int) -> dict:
+    return {
+        "id": f"proj_{i}",
+        "name": f"Project {i}",
+        "status": "active",
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-01T00:00:00",
+    }
+
+
+class TestListProjects:
+    def test_stops_reading_after_page_plus_one(self, repo):
+        """Test list_projects only consumes first + 1 items from the query"""
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield _doc(i)
+
+        repo.container.query_items.return_value = items()
+
+        projects, has_next = repo.list_projects(first=5)
+
+        assert [p.id for p in projects] == [f"proj_{i}" for i in range(5)]
+        assert has_next is True
+        assert len(consumed) == 6
+
+    def test_last_page_has_no_next(self, repo):
+        """Test a short result set reports no further pages"""
+        repo.container.query_items.return_value = iter([_doc(1), _doc(2)])
+
+        projects, has_next = repo.list_projects(first=5)
+
+        assert len(projects) == 2
+        assert has_next is False
+
+    def test_name_filter_uses_case_insensitive_contains(self, repo):
+        """Test name filtering relies on CONTAINS' ignore-case flag"""
+        repo.container.query_items.return_value = iter([])
+
+        repo.list_projects(name_contains="apollo")
+
+        query = repo.container.query_items.call_args.kwargs["query"]
+        assert "CONTAINS(c.name, @name, true)" in query
+        assert "UPPER(c.name), UPPER" not in query
+
+
+class TestGetProjectCount:
+    def test_filters_match_list_projects(self, repo):
+        """Test count and list queries share the same filter clause and parameters"""
+        repo.container.query_items.return_value = iter([3])
+        filters = {"status": ProjectStatus.ACTIVE, "owner_id": "user_1", "tags": ["a", "b"]}
+
+        assert repo.get_project_count(**filters) == 3
+        count_call = repo.container.query_items.call_args.kwargs
+
+        repo.container.query_items.return_value = iter([])
+        repo.list_projects(**filters)
+        list_call = repo.container.query_items.call_args.kwargs
+
+        assert count_call["parameters"] == list_call["parameters"]
+        assert [p["name"] for p in count_call["parameters"]] == [
+            "@status",
+            "@owner_id",
+            "@tag0",
+            "@tag1",
+        ]
+        where = count_call["query"].split("WHERE", 1)[1]
+        assert where in list_call["query"]
+
+
+class TestStatusSummary:
+    def test_counts_each_status_with_one_parameterized_query(self, repo):
+        """Test the summary binds each status into the same COUNT text, skipping empty ones"""
+        counts = {"active": 2, "archived": 0, "draft": 3, "completed": 0}
+        repo.container.query_items.side_effect = lambda **kwargs: iter(
+            [counts[kwargs["parameters"][0]["value"]]]
+        )
+
+        assert repo.get_projects_by_status_summary() == {"active": 2, "draft": 3}
+        calls = repo.container.query_items.call_args_list
+        assert [c.kwargs["parameters"][0]["value"] for c in calls] == list(counts)
+        assert {c.kwargs["query"] for c in calls} == {
+            "SELECT VALUE COUNT(1) FROM c WHERE c.type = 'project' AND c.status = @status"
+        }
+
+    def test_query_failure_is_raised(self, repo):
+        """Test a failed count surfaces instead of reporting zero projects"""
+        repo.container.query_items.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="Failed to count active projects: boom"):
+            repo.get_projects_by_status_summary()